@@ -1,9 +1,22 @@
 import argparse
-from os import path, makedirs
+import hashlib
+import io
+import logging
+import threading
+from itertools import islice, tee
+from logging.handlers import QueueHandler, QueueListener
+from os import path, makedirs, remove, replace
+from queue import Queue
 from time import sleep
+from contextlib import ExitStack, contextmanager
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime, timedelta
-from csv import writer as csv_writer
 
+import pyarrow as pa
+import requests
+from pyarrow.csv import (
+    ConvertOptions, CSVWriter, ParseOptions, WriteOptions, open_csv
+)
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -12,6 +25,83 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 
+logger = logging.getLogger(__name__)
+
+# Columns of exported csv files
+SCHEMA = pa.schema([("datetime", pa.string()), ("tweet", pa.string())])
+
+# Bearer token of Twitter's public web client, used to request guest tokens
+API_BEARER = (
+    "AAAAAAAAAAAAAAAAAAAAANRILgAAAAAAnNwIzUejRCOuH5E6I8xnZz4puTs"
+    "%3D1Zv7ttfk8LF81IUq16cHjhLTvJu4FA33AGWWjCpTnA"
+)
+GUEST_TOKEN_URL = "https://api.twitter.com/1.1/guest/activate.json"
+SEARCH_API_URL = "https://api.twitter.com/2/search/adaptive.json"
+# Responses meaning the endpoint is closed to us, rather than a passing error
+API_BLOCKED_STATUS = {401, 403, 404, 410}
+
+# Container of a single rendered tweet
+TWEET_CSS = "div.css-1dbjc4n.r-1iusvr4.r-16y2uox.r-1777fci.r-kzbkwu"
+
+# Rendered by Twitter once there are no more search results
+END_CSS = 'div[data-testid="emptyState"]'
+
+# True once a scroll has rendered tweets that haven't been scraped yet or the
+# end of results
+PENDING_JS = """
+return document.querySelector(
+    arguments[0] + ':not([data-scraped]), ' + arguments[1]
+) !== null;
+"""
+
+# Scrape [datetime, text] of every rendered tweet not yet tagged as scraped,
+# tag them, and scroll to the last rendered tweet in a single round trip.
+# Returns the rows and whether the end of results has been rendered.
+# Videos are paused first or tweets with videos come back as duplicates.
+# Chrome still autoplays muted videos with autoplay disabled.
+SCRAPE_JS = """
+document.querySelectorAll('video').forEach(vid => vid.pause());
+const ended = document.querySelector(arguments[1]) !== null;
+const tweets = document.querySelectorAll(arguments[0] + ':not([data-scraped])');
+const rows = [...tweets].map(el => {
+    el.setAttribute('data-scraped', '1');
+    const time = el.querySelector('a time');
+    return [time ? time.getAttribute('datetime') : null, el.innerText];
+});
+const rendered = document.querySelectorAll(arguments[0]);
+if (rendered.length) {
+    rendered[rendered.length - 1].scrollIntoView();
+}
+return [rows, ended];
+"""
+
+
+class SharedWriter:
+    """Serialize writes to a csv writer shared by workers."""
+
+    def __init__(self, writer):
+        self._writer = writer
+        self._lock = threading.Lock()
+
+    def append_csv(self, filepath: str) -> None:
+        """Stream rows of a csv file written by ``TweetScraper.export_csv``
+        into the shared writer, without other workers' rows in between."""
+        with open(filepath, "rb") as f:
+            reader = open_csv(
+                f,
+                # Tweets span multiple lines
+                parse_options=ParseOptions(newlines_in_values=True),
+                # Read back exactly what was written, nulls included
+                convert_options=ConvertOptions(
+                    column_types=SCHEMA,
+                    strings_can_be_null=True,
+                    quoted_strings_can_be_null=False
+                )
+            )
+            with self._lock:
+                for batch in reader:
+                    self._writer.write_batch(batch)
+
 
 class TweetScraper:
     """Class used to scrape twitter data from "Explore" page.html
@@ -40,19 +130,31 @@ class TweetScraper:
         "Top" or "Latest" tweet page.
     language : str, default "en"
         Language of tweets.
+    workers : int, default 1
+        Number of webdriver instances scraping days in parallel.
+    use_api : bool, default False
+        Try Twitter's JSON search endpoint before falling back to the browser.
+        Tweet text from the endpoint is only the tweet body.
+    single_file : bool, default False
+        Export all days to one csv file instead of one file per day.
 
     Methods
     -------
     query_string(date_since, date_until)
         Build Twitter URL with query string based on object attributes.
     date_rng(start, end)
-        Create list of string dates between `start` and `end` dates.
-    scrape_visible_data(driver, css_selector, text=True, scroll=False)
-        Scrapes visible data (datetime or tweet text) from browser.
-    scrape_full_page(driver)
-        Scrape all tweets and datetimes by scrolling Twitter Explore page.
-    export_csv(filename, data, folder=None)
-        Write data to csv file.
+        Yield string dates between `start` and `end` dates.
+    write_rows(writer, rows, seen)
+        Write rows not already in ``seen`` to ``writer``.
+    scrape_full_page(driver, writer, seen)
+        Scrape all tweets and datetimes by scrolling Twitter Explore page,
+        streaming them to ``writer``.
+    export_csv(filepath)
+        Open csv file to stream rows into.
+    scrape_api(start_day, end_day, writer, seen)
+        Scrape all tweets for a day from Twitter's JSON search endpoint.
+    scrape_day(start_day, end_day)
+        Scrape a single day and export it to csv.
     run_scraper()
         Run full scraping process for all individual days in date range
         between ``obj.date_start`` and ``obj.date_end`` attributes.
@@ -67,7 +169,10 @@ class TweetScraper:
                  min_retweets: int = 0,
                  min_replies: int = 0,
                  page: str = "top",
-                 language: str = "en"):
+                 language: str = "en",
+                 workers: int = 1,
+                 use_api: bool = False,
+                 single_file: bool = False):
         """
         Parameters
         ----------
@@ -89,6 +194,13 @@ class TweetScraper:
             "Top" or "Latest" tweet page.
         language : str, default "en"
             Language of tweets.
+        workers : int, default 1
+            Number of webdriver instances scraping days in parallel.
+        use_api : bool, default False
+            Try Twitter's JSON search endpoint before falling back to the
+            browser. Tweet text from the endpoint is only the tweet body.
+        single_file : bool, default False
+            Export all days to one csv file instead of one file per day.
 
         Raises
         ------
@@ -110,6 +222,39 @@ class TweetScraper:
         self.min_replies = min_replies
         self.page = page
         self.language = language
+        self.workers = workers
+        self.use_api = use_api
+        self.single_file = single_file
+
+        # Only the dates change between days
+        self._url_tmpl = (
+            f"https://twitter.com/search?q=({coin_name}"
+            f"%20OR%20{coin_abbrv})"
+            f"%20min_replies%3A{min_replies}"
+            f"%20min_faves%3A{min_faves}"
+            f"%20min_retweets%3A{min_retweets}"
+            f"%20lang%3A{language}"
+            f"%20until%3A{{until}}"
+            f"%20since%3A{{since}}"
+            f"&src=typed_query&f={page.lower()}"
+        )
+        self._query_tmpl = (
+            f"({coin_name} OR {coin_abbrv})"
+            f" min_replies:{min_replies}"
+            f" min_faves:{min_faves}"
+            f" min_retweets:{min_retweets}"
+            f" lang:{language}"
+            f" until:{{until}}"
+            f" since:{{since}}"
+        )
+        self._folder = path.join("Tweets", coin_name)
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._drivers = []
+        self._driver_path = None
+        self._api_blocked = False
+        self._writer = None  # Shared by all days if ``single_file``
 
     def query_string(self, date_since: str, date_until: str) -> str:
         """Build Twitter URL with query string based on object's
@@ -131,128 +276,97 @@ class TweetScraper:
         str
             URL with query string for twitter search.
         """
-        url = (
-            f"https://twitter.com/search?q=({self.coin_name}"
-            f"%20OR%20{self.coin_abbrv})"
-            f"%20min_replies%3A{self.min_replies}"
-            f"%20min_faves%3A{self.min_faves}"
-            f"%20min_retweets%3A{self.min_retweets}"
-            f"%20lang%3A{self.language}"
-            f"%20until%3A{date_until}"
-            f"%20since%3A{date_since}"
-            f"&src=typed_query&f={self.page.lower()}"
-        )
-        return url
+        return self._url_tmpl.format(until=date_until, since=date_since)
 
     @staticmethod
     def date_rng(start: datetime, end: datetime):
-        """Create list of string dates between `start` and `end` dates.
+        """Yield string dates between `start` and `end` dates.
 
-        Returned date format "YYYY-MM-DD".
+        Yielded date format "YYYY-MM-DD".
 
         Parameters
         ----------
         start : datetime
         end : datetime
 
-        Returns
-        -------
-        list of strs
-            All days between (and including) `start` and `end`.
+        Yields
+        ------
+        str
+            Each day between (and including) `start` and `end`.
             String dates formatted like "YYYY-MM-DD".
         """
-        delta = end - start  # timedelta obj
-        days = [(start + timedelta(days=i)).strftime("%Y-%m-%d")
-                for i in range(delta.days+1)]
-        return days
+        day = start
+        while day <= end:
+            yield day.strftime("%Y-%m-%d")
+            day += timedelta(days=1)
 
     @staticmethod
-    def scrape_visible_data(driver,
-                            css_selector: str,
-                            text: bool = True,
-                            scroll: bool = False) -> list:
-        """Scrape visible data (datetime or tweet text) from browser.
-
-        If ``text`` is False, will return datetimes (as strings). If True,
-        function will return text of entire tweet including:
-            * User name
-            * Account Name (e.g. "@twitter")
-            * Number of replies
-            * Number of retweets
-            * Number of favorites
-            * Tweet body, user name, account handle within a quote/nested tweet
-
-        Returned text will be one long string with key elements of tweet
-        separable by new line character "\n".
+    def write_rows(writer, rows, seen: set) -> None:
+        """Write rows not already in ``seen`` to ``writer``.
 
         Parameters
         ----------
-        driver : selenium web driver object
-        css_selector : str
-            Used to find tweets on the webpage.
-        text : bool, default True
-            If this is False the function will return list of datetimes (as
-            strings) for each tweet.
-        scroll : bool, default False
-            If True, have browser (``driver``) scroll page to the last element.
-
-        Returns
-        -------
-        list
-            Either list of string datetimes OR list of tweet texts dependent on
-            the ``text`` param.
+        writer : object
+            Any writer with a ``write_batch(RecordBatch)`` method, e.g.
+            ``pyarrow.csv.CSVWriter``.
+        rows : iterable
+            Pairs formatted like (datetime: str, tweet: str).
+        seen : set
+            16 byte digests of rows already written. Updated in place.
         """
-        web_elems = driver.find_elements(By.CSS_SELECTOR, css_selector)
-        if not text:
-            data = [time.get_attribute("datetime") for time in web_elems]
-        else:
-            data = [element.text for element in web_elems]
-
-        if scroll:
-            last_elem_loc = web_elems[-1].location
-            x = last_elem_loc["x"]
-            y = last_elem_loc["y"]
-            driver.execute_script(f"window.scrollTo({x}, {y})")
-
-        return data
+        datetimes, tweets = [], []
+        for dt, tweet in rows:
+            h = hashlib.blake2s(
+                f"{dt}\x1f{tweet}".encode(),
+                digest_size=16
+            ).digest()
+            if h not in seen:
+                seen.add(h)
+                datetimes.append(dt)
+                tweets.append(tweet)
+        if datetimes:
+            writer.write_batch(pa.RecordBatch.from_arrays(
+                [pa.array(datetimes, pa.string()),
+                 pa.array(tweets, pa.string())],
+                schema=SCHEMA
+            ))
 
     @staticmethod
-    def scrape_full_page(driver) -> set:
+    def scrape_full_page(driver, writer, seen: set) -> None:
         """Scrape all tweets and datetimes by scrolling Twitter Explore page.
 
+        Rows not already in ``seen`` are written to ``writer`` after every
+        scroll, so only one scroll's worth of tweets is held in memory.
+
         Parameters
         ----------
         driver : selenium web driver object
-
-        Returns
-        -------
-        set
-            Set of tuples. Tuples formatted like (datetime: str, tweet: str).
+        writer : object
+            Any writer with a ``write_batch(RecordBatch)`` method, e.g.
+            ``pyarrow.csv.CSVWriter``.
+        seen : set
+            16 byte digests of rows already written. Updated in place.
         """
-        full_tweets = set()
-        css = (
-            "div.css-1dbjc4n.r-1iusvr4.r-16y2uox.r-1777fci.r-kzbkwu"
-        )
-        num_tweets = len(full_tweets)
+        num_tweets = len(seen)
         break_count = 0
         num_scrolls = 0
         while True:
-            # Pause all videos before scraping or will get duplicates
-            # on any tweets with videos
-            driver.execute_script(
-                "document.querySelectorAll('video').forEach(vid => vid.pause());"
-            )
-            sleep(1.5)
-            datetimes = TweetScraper.scrape_visible_data(
-                driver,
-                css_selector="a time",
-                text=False)
-            tweets = TweetScraper.scrape_visible_data(driver, css_selector=css, scroll=True)
-            assert len(tweets) == len(datetimes), (
-                "DIFFERENT NUMBER OF TWEETS AND DATETIMES"
-            )
-            full_tweets.update(set(zip(datetimes, tweets)))
-            if num_tweets == len(full_tweets):
+            # Wait for the last scroll to render new tweets. On timeout the
+            # scraped set won't grow and the break count path takes over.
+            try:
+                WebDriverWait(driver, timeout=3).until(
+                    lambda d: d.execute_script(PENDING_JS, TWEET_CSS, END_CSS)
+                )
+            except TimeoutException:
+                pass
+            # Only tweets rendered since the last scroll come back, the
+            # digest check in write_rows is a safety net for re-rendered nodes
+            rows, ended = driver.execute_script(SCRAPE_JS, TWEET_CSS, END_CSS)
+            TweetScraper.write_rows(writer, rows, seen)
+            if ended:
+                break
+            # Fallback for when the end of results isn't rendered
+            if num_tweets == len(seen):
                 break_count += 1
                 if break_count >= 3:
                     break
@@ -263,99 +377,381 @@ class TweetScraper:
                 break_count = 0
 
             num_scrolls += 1
+            # Reclaim memory of tweets the page has unmounted while scrolling
+            if num_scrolls % 100 == 0:
+                driver.execute_script("window.gc && window.gc()")
             if num_scrolls > 3200:
                 raise Exception(
                     "MAXIMUM NUMBER OF SCROLLS REACHED"
                 )
-            num_tweets = len(full_tweets)
-
-        return full_tweets
+            num_tweets = len(seen)
 
     @staticmethod
-    def export_csv(filename: str, data, folder: str = None) -> None:
-        """Write data to csv file.
+    @contextmanager
+    def export_csv(filepath: str):
+        """Open csv file to stream rows into.
+
+        Yields a pyarrow csv writer that writes the header row followed by
+        each record batch given to it. The file is closed when the context
+        exits.
 
         Parameters
         ----------
-        filename : str
-        data : iterable
-        folder : str, optional
-            Export file to folder inside of working directory. If folder
-            doesn't already exist, it will be created.
+        filepath : str
+            Path of file to write. Its folder must already exist.
+
+        Yields
+        ------
+        pyarrow.csv.CSVWriter
         """
-        if folder:
-            if not path.exists(folder):
-                makedirs(folder)
-            filename = folder + '/' + filename
+        # Coalesce batches into ~1 MiB writes, flushed on close
+        raw = open(filepath, "wb", buffering=0)
+        with io.BufferedWriter(raw, buffer_size=1 << 20) as f, CSVWriter(
+            f,
+            SCHEMA,
+            write_options=WriteOptions(batch_size=8192)
+        ) as writer:
+            yield writer
+
+    def _get_driver(self):
+        """Return webdriver owned by the calling worker thread.
+
+        The driver is launched on first use and reused for every day the
+        thread scrapes afterwards.
+        """
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            with self._lock:
+                if self._driver_path is None:
+                    self._driver_path = ChromeDriverManager().install()
+            options = Options()
+            # driver.get returns once DOMContentLoaded fires
+            options.page_load_strategy = "eager"
+            # No need to render the page, images, or videos to scrape text
+            options.add_argument("--headless=new")
+            options.add_argument("--disable-gpu")
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_argument("--js-flags=--expose-gc")
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.autoplay": 2,
+            })
+            driver = webdriver.Chrome(
+                service=Service(self._driver_path),
+                options=options
+            )
+            # Fail fast on hung assets instead of ChromeDriver's defaults
+            driver.set_page_load_timeout(20)
+            driver.set_script_timeout(10)
+            self._local.driver = driver
+            with self._lock:
+                self._drivers.append(driver)
+        return driver
 
-        with open(filename, "w") as f:
-            writer = csv_writer(f)
-            writer.writerow(["datetime", "tweet"])
-            writer.writerows(data)
+    @staticmethod
+    def _api_request(session, method: str, url: str, **kwargs):
+        """Send search API request, retrying rate limits and network errors.
 
-    def run_scraper(self):
-        """Run full scraping process.
+        Up to 3 attempts are made with exponential backoff on timeouts,
+        connection errors, 429 and 5xx responses.
 
-        Loops through each day in the range between ``obj.date_start`` and
-        ``obj.date_end`` making a url request for each individual day. For each
-        date, the webdriver will scroll down the page to render the max amount
-        of tweets and scrape the info. The info for each date scraped will be
-        exported to a folder in the working directory called "exports/". Each
-        file will be named with the coin abbreviation (``obj.coin_abbrv``) and
-        date (the until/end date).
+        Raises
+        ------
+        requests.RequestException
+            If the request still fails after retrying or is refused outright.
+        """
+        for attempt in range(3):
+            if attempt:
+                sleep(2 ** attempt)
+            try:
+                resp = session.request(method, url, timeout=20, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == 2:
+                    raise
+                continue
+            if resp.status_code == 429 or resp.status_code >= 500:
+                if attempt < 2:
+                    continue
+            resp.raise_for_status()
+            return resp.json()
+
+    def _get_session(self) -> requests.Session:
+        """Return search API session owned by the calling worker thread.
+
+        The session is created with a fresh guest token on first use and
+        keeps its HTTPS connections alive for every later request.
         """
-        options = Options()
-        options.headless = False
-        driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=options
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers["authorization"] = f"Bearer {API_BEARER}"
+            data = self._api_request(session, "POST", GUEST_TOKEN_URL)
+            session.headers["x-guest-token"] = data["guest_token"]
+            self._local.session = session
+        return session
+
+    def scrape_api(self, start_day: str, end_day: str, writer, seen: set):
+        """Scrape all tweets for a day from Twitter's JSON search endpoint.
+
+        Pages through the search results by cursor, writing each page to
+        ``writer`` as it arrives. Tweet text is only the tweet body, not the
+        user name, handle, and counts rendered in the browser.
+
+        Parameters
+        ----------
+        start_day : str
+            Beginning of day to scrape, formatted like "YYYY-MM-DD".
+        end_day : str
+            End of day to scrape, formatted like "YYYY-MM-DD".
+        writer : object
+            Any writer with a ``write_batch(RecordBatch)`` method, e.g.
+            ``pyarrow.csv.CSVWriter``.
+        seen : set
+            16 byte digests of rows already written. Updated in place.
+
+        Raises
+        ------
+        requests.RequestException
+            If the endpoint can't be reached or refuses the request.
+        """
+        session = self._get_session()
+        params = {
+            "q": self._query_tmpl.format(until=end_day, since=start_day),
+            "tweet_mode": "extended",
+            "query_source": "typed_query",
+            "count": 100,
+        }
+        if self.page.lower() == "latest":
+            params["tweet_search_mode"] = "live"
+
+        cursor = None
+        while True:
+            data = self._api_request(
+                session, "GET", SEARCH_API_URL, params=params
+            )
+
+            # Only timeline results match the query, the tweets lookup table
+            # also holds quoted tweets from other days or below thresholds
+            tweets = data["globalObjects"]["tweets"]
+            rows = []
+            num_results = 0
+            prev_cursor, cursor = cursor, None
+            for instruction in data["timeline"]["instructions"]:
+                entries = instruction.get("addEntries", {}).get("entries", [])
+                if "replaceEntry" in instruction:
+                    entries = [instruction["replaceEntry"]["entry"]]
+                for entry in entries:
+                    if entry["entryId"].startswith("sq-I-t-"):
+                        num_results += 1
+                        tweet_id = entry["content"]["item"]["content"]["tweet"]["id"]
+                        tweet = tweets.get(tweet_id)
+                        if tweet is None:  # Deleted or withheld
+                            continue
+                        # Match the format of the datetime attribute scraped
+                        # from the page
+                        rows.append((datetime.strptime(
+                            tweet["created_at"], "%a %b %d %H:%M:%S %z %Y"
+                        ).strftime("%Y-%m-%dT%H:%M:%S.000Z"), tweet["full_text"]))
+                    elif entry["entryId"] == "sq-cursor-bottom":
+                        cursor = entry["content"]["operation"]["cursor"]["value"]
+            self.write_rows(writer, rows, seen)
+            if not num_results or cursor is None or cursor == prev_cursor:
+                break
+            params["cursor"] = cursor
+
+    @contextmanager
+    def _day_output(self, end_day: str):
+        """Yield csv writer and set of written row digests for a day.
+
+        The day is streamed to its own file under a ".part" name. On success
+        it's renamed into place, or with ``obj.single_file`` appended to the
+        run's shared file and removed. On error it's removed, so a failed
+        attempt (e.g. the search API falling back to the browser) leaves no
+        rows behind.
+        """
+        filepath = path.join(
+            self._folder,
+            f"{self.coin_abbrv}_tweets_{end_day}.csv"
         )
+        part = filepath + ".part"
+        try:
+            with self.export_csv(part) as writer:
+                yield writer, set()
+            if self._writer is not None:
+                self._writer.append_csv(part)
+        except BaseException:
+            if path.exists(part):
+                remove(part)
+            raise
+        if self._writer is not None:
+            remove(part)
+        else:
+            replace(part, filepath)
 
-        dates = self.date_rng(self.date_start, self.date_end)
-        i = 0
-        err_counter = 0
-        with open("errors.log", "a") as logf:
-            while i < len(dates)-1:
+    def scrape_day(self, start_day: str, end_day: str) -> None:
+        """Scrape a single day and export it to csv.
+
+        Loading and scraping the page is attempted up to 3 times with
+        exponential backoff before giving up on the day.
+
+        Parameters
+        ----------
+        start_day : str
+            Beginning of day to scrape, formatted like "YYYY-MM-DD".
+        end_day : str
+            End of day to scrape, formatted like "YYYY-MM-DD".
+
+        Raises
+        ------
+        WebDriverException
+            If every attempt to scrape the day fails.
+        """
+        if self.use_api and not self._api_blocked:
+            try:
+                with self._day_output(end_day) as (writer, seen):
+                    self.scrape_api(start_day, end_day, writer, seen)
+                return
+            except (requests.RequestException, AttributeError, KeyError,
+                    TypeError, ValueError) as err:
+                # Only give up on the endpoint for the rest of the run if it
+                # refuses us or its response schema changed
+                if isinstance(err, (AttributeError, KeyError, TypeError)) or (
+                    isinstance(err, requests.HTTPError)
+                    and err.response.status_code in API_BLOCKED_STATUS
+                ):
+                    self._api_blocked = True
+                    print(f"Search API unavailable {end_day}. Using browser")
+                else:
+                    print(f"Search API failed {end_day}. Using browser for day")
+                logger.warning("Search API - '%s'. Error: '%s'", end_day, err)
+
+        driver = self._get_driver()
+        url = self.query_string(
+            date_since=start_day,
+            date_until=end_day,
+        )
+        # Blank file is exported if no tweets meet threshold
+        with self._day_output(end_day) as (writer, seen):
+            # Rows from a failed attempt are kept, ``seen`` skips them on retry
+            for attempt in range(3):
                 try:
-                    start_day = dates[i]
-                    end_day = dates[i+1]
-                    url = self.query_string(
-                        date_since=start_day,
-                        date_until=end_day,
-                    )
                     driver.get(url)
                     delay = 30
 
                     WebDriverWait(
                         driver,
                         timeout=delay
-                    ).until(lambda d: d.find_element(By.TAG_NAME, "time"))
-                    sleep(7)
+                    ).until(lambda d: d.find_elements(
+                        By.CSS_SELECTOR, f"time, {END_CSS}"
+                    ))
 
-                    data = self.scrape_full_page(driver)
+                    self.scrape_full_page(driver, writer, seen)
+                    break
                 except TimeoutException:
-                    print(f"Timeout - start:'{start_day}', end: '{end_day}'")
-                    logf.write(f"\nTimeout - '{end_day}'")
-                    data = []  # Export blank file if no tweets meet threshold
-                except WebDriverException:
-                    err_counter += 1
-                    if err_counter >= 5:
-                        print("Error Counter >= threshold. FUNCTION TERMINATED")
+                    if attempt == 2:
+                        print(f"Timeout - start:'{start_day}', end: '{end_day}'")
+                        logger.warning("Timeout - '%s'", end_day)
                         break
-                    continue
-                except Exception as err:
-                    logf.write(f"\nEnd Date: {end_day}. Error: '{err}'")
-                    print(f"Error logged {end_day}")
-                    i += 1
-                    continue
+                except WebDriverException:
+                    if attempt == 2:
+                        raise
+                sleep(2 ** attempt)
 
-                filename = f"{self.coin_abbrv}_tweets_{end_day}.csv"
-                folder = f"Tweets/{self.coin_name}"
-                self.export_csv(filename=filename, data=data, folder=folder)
-                sleep(1)
-                i += 1
+        # Reset browser state between days without relaunching Chrome
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        sleep(1)
 
-        driver.quit()
+    def run_scraper(self):
+        """Run full scraping process.
+
+        Loops through each day in the range between ``obj.date_start`` and
+        ``obj.date_end`` making a url request for each individual day. For each
+        date, the webdriver will scroll down the page to render the max amount
+        of tweets and scrape the info. The info for each date scraped will be
+        exported to a folder in the working directory called "exports/". Each
+        file will be named with the coin abbreviation (``obj.coin_abbrv``) and
+        date (the until/end date).
+
+        Days are distributed across ``obj.workers`` threads, each driving its
+        own webdriver instance. If ``obj.use_api`` is True, days are fetched
+        from Twitter's JSON search endpoint instead, falling back to the
+        browser for a day the endpoint fails on and for every day after it
+        refuses requests. If ``obj.single_file`` is True, all days are
+        exported to a single file named with the coin abbreviation and the
+        start and end dates.
+        """
+        makedirs(self._folder, exist_ok=True)
+        with ExitStack() as stack:
+            # Runs last, after the pool has finished, even on Ctrl-C
+            stack.callback(self._quit_drivers)
+            if self.single_file:
+                filepath = path.join(
+                    self._folder,
+                    f"{self.coin_abbrv}_tweets"
+                    f"_{self.date_start:%Y-%m-%d}_{self.date_end:%Y-%m-%d}.csv"
+                )
+                self._writer = SharedWriter(
+                    stack.enter_context(self.export_csv(filepath))
+                )
+
+            # Workers log through a queue so file writes happen on one thread
+            log_queue = Queue()
+            file_handler = logging.FileHandler("errors.log")
+            file_handler.setFormatter(
+                logging.Formatter("%(asctime)s %(levelname)s %(message)s")
+            )
+            stack.callback(file_handler.close)
+            listener = QueueListener(log_queue, file_handler)
+            listener.start()
+            stack.callback(listener.stop)
+            queue_handler = QueueHandler(log_queue)
+            logger.addHandler(queue_handler)
+            stack.callback(logger.removeHandler, queue_handler)
+
+            since_days, until_days = tee(self.date_rng(self.date_start, self.date_end))
+            next(until_days, None)
+            days = zip(since_days, until_days)
+            err_counter = 0
+            futures = {}
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                try:
+                    while err_counter < 5:
+                        # Only keep a couple of days per worker in flight
+                        window = 2 * self.workers - len(futures)
+                        for start_day, end_day in islice(days, window):
+                            future = executor.submit(
+                                self.scrape_day, start_day, end_day
+                            )
+                            futures[future] = end_day
+                        if not futures:
+                            break
+
+                        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            end_day = futures.pop(future)
+                            try:
+                                future.result()
+                            except WebDriverException as err:
+                                err_counter += 1
+                                logger.error("End Date: %s. Error: '%s'", end_day, err)
+                            except Exception as err:
+                                logger.error("End Date: %s. Error: '%s'", end_day, err)
+                                print(f"Error logged {end_day}")
+                    else:
+                        print("Error Counter >= threshold. FUNCTION TERMINATED")
+                finally:
+                    # Drop queued days so the pool only waits for the running
+                    # ones, including on Ctrl-C
+                    for future in futures:
+                        future.cancel()
+
+    def _quit_drivers(self) -> None:
+        """Quit every worker's webdriver and reset run state."""
+        self._writer = None
+        for driver in self._drivers:
+            driver.quit()
+        self._drivers = []
 
 
 if __name__ == "__main__":
@@ -411,6 +807,24 @@ if __name__ == "__main__":
         default="top",
         help="'Top' or 'Latest' tweet page to search on."
     )
+    parser.add_argument("-workers",
+        dest="workers",
+        type=int,
+        default=1,
+        help="Number of browser instances scraping days in parallel."
+    )
+    parser.add_argument("-api",
+        dest="use_api",
+        action="store_true",
+        help=("Fetch days from Twitter's search API, falling back to the "
+              "browser. Tweet text from the API is only the tweet body.")
+    )
+    parser.add_argument("-single",
+        "--single-file",
+        dest="single_file",
+        action="store_true",
+        help="Export all days to one csv file instead of one file per day."
+    )
 
     args = parser.parse_args()
     if " " in args.coin_name:
@@ -425,6 +839,10 @@ if __name__ == "__main__":
         raise ValueError(
             "'page' argument must be 'top' or 'latest'"
         )
+    if args.workers < 1:
+        raise ValueError(
+            "'workers' argument must be at least 1"
+        )
 
     CL_PARAMS = {
         "date_start": args.date_start,
@@ -434,7 +852,10 @@ if __name__ == "__main__":
         "min_faves": args.min_faves,
         "min_retweets": args.min_retweets,
         "min_replies": args.min_replies,
-        "page": args.page
+        "page": args.page,
+        "workers": args.workers,
+        "use_api": args.use_api,
+        "single_file": args.single_file
     }
 
     scraper = TweetScraper(**CL_PARAMS)